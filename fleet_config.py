@@ -0,0 +1,234 @@
+import os
+import sys
+import mmap
+import glob
+import difflib
+from array import array
+
+# --- Variabel Global ---
+BACKUP_DIR = "backup"
+CONFIG_PATTERN = "*.cfg"
+
+# ============================================================
+#                     FUNGSI PEMBANTU
+# ============================================================
+def split_config(text):
+    """Memecah teks konfigurasi per baris.
+
+       Aturan sama dengan add_file(): pecah pada '\n' lalu buang satu
+       '\r' di akhir baris, sehingga hasil get_config() dan file backup
+       menghasilkan array ID yang sama.
+    """
+    lines = text.split("\n")
+    if lines[-1] == "":
+        lines.pop()
+    return [ln[:-1] if ln.endswith("\r") else ln for ln in lines]
+
+def format_range(start, stop):
+    """Format range hunk seperti difflib.unified_diff."""
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+# ============================================================
+#               MODEL KONFIGURASI FLEET (KOMPAK)
+# ============================================================
+class FleetConfig:
+    """Menyimpan konfigurasi banyak perangkat secara kompak.
+
+       Setiap baris unik disimpan sekali di tabel bersama (interning),
+       sedangkan konfigurasi per perangkat hanya berupa array ID baris.
+       Baris yang sama di banyak perangkat (AAA, NTP, logging, dll.)
+       tidak lagi diduplikasi di memori.
+    """
+
+    def __init__(self):
+        self.lines = []       # ID -> teks baris
+        self.line_ids = {}    # teks baris -> ID
+        self.configs = {}     # "S1_pre" -> array("I") berisi ID baris
+
+    def intern_line(self, text):
+        """Mengembalikan ID untuk baris, menambahkannya ke tabel bila baru."""
+        line_id = self.line_ids.get(text)
+        if line_id is None:
+            line_id = len(self.lines)
+            self.lines.append(text)
+            self.line_ids[text] = line_id
+        return line_id
+
+    def add_text(self, key, text):
+        """Menambahkan konfigurasi dari string (mis. hasil get_config())."""
+        ids = array("I", (self.intern_line(ln) for ln in split_config(text)))
+        self.configs[key] = ids
+        return ids
+
+    def add_file(self, key, path):
+        """Memuat file konfigurasi memakai mmap, baris demi baris."""
+        ids = array("I")
+        with open(path, "rb") as f:
+            # mmap tidak bisa dipakai untuk file kosong
+            if os.fstat(f.fileno()).st_size == 0:
+                self.configs[key] = ids
+                return ids
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for raw in iter(mm.readline, b""):
+                    if raw.endswith(b"\n"):
+                        raw = raw[:-1]
+                    if raw.endswith(b"\r"):
+                        raw = raw[:-1]
+                    text = raw.decode("utf-8", errors="replace")
+                    ids.append(self.intern_line(text))
+        self.configs[key] = ids
+        return ids
+
+    def load_dir(self, folder=BACKUP_DIR, pattern=CONFIG_PATTERN):
+        """Memuat semua file konfigurasi di folder backup."""
+        for path in sorted(glob.glob(os.path.join(folder, pattern))):
+            key = os.path.splitext(os.path.basename(path))[0]
+            self.add_file(key, path)
+        return len(self.configs)
+
+    def get_text(self, key):
+        """Menyusun ulang teks konfigurasi dari array ID."""
+        lines = self.lines
+        return "".join(lines[i] + "\n" for i in self.configs[key])
+
+    def diff(self, a_key, b_key):
+        """Menghasilkan unified diff antara dua konfigurasi.
+
+           Perbandingan dilakukan pada ID (integer), teks baris hanya
+           diambil dari tabel untuk bagian yang berubah.
+        """
+        a = self.configs[a_key]
+        b = self.configs[b_key]
+        if a == b:
+            return ""
+        # list of int lebih cepat diindeks SequenceMatcher daripada array
+        a, b = a.tolist(), b.tolist()
+
+        lines = self.lines
+        out = [f"--- {a_key}\n", f"+++ {b_key}\n"]
+        matcher = difflib.SequenceMatcher(None, a, b)
+        for group in matcher.get_grouped_opcodes(3):
+            i1, i2 = group[0][1], group[-1][2]
+            j1, j2 = group[0][3], group[-1][4]
+            out.append(f"@@ -{format_range(i1, i2)} +{format_range(j1, j2)} @@\n")
+            for tag, a1, a2, b1, b2 in group:
+                if tag == "equal":
+                    out.extend(" " + lines[i] + "\n" for i in a[a1:a2])
+                    continue
+                if tag in ("replace", "delete"):
+                    out.extend("-" + lines[i] + "\n" for i in a[a1:a2])
+                if tag in ("replace", "insert"):
+                    out.extend("+" + lines[i] + "\n" for i in b[b1:b2])
+        return "".join(out)
+
+    def search(self, pattern):
+        """Mencari perangkat yang memiliki baris berisi pattern.
+
+           Pencarian dilakukan sekali pada tabel baris unik, lalu
+           dicocokkan ke setiap perangkat berdasarkan ID.
+        """
+        matched = {i for i, text in enumerate(self.lines) if pattern in text}
+        if not matched:
+            return {}
+        result = {}
+        for key, ids in self.configs.items():
+            hits = [self.lines[i] for i in ids if i in matched]
+            if hits:
+                result[key] = hits
+        return result
+
+    def stats(self):
+        """Statistik singkat: jumlah konfigurasi, total baris, baris unik."""
+        total = sum(len(ids) for ids in self.configs.values())
+        return {
+            "configs": len(self.configs),
+            "total_lines": total,
+            "unique_lines": len(self.lines),
+        }
+
+# ============================================================
+#                       SELF-CHECK
+# ============================================================
+def self_check(rounds=200, seed=0):
+    """Membandingkan diff() dan search() dengan cara naif (difflib/scan)."""
+    import random
+
+    rng = random.Random(seed)
+    pool = [f"line {i}" for i in range(30)] + ["vlan 50", "", "a\rb"]
+    fleet = FleetConfig()
+    texts = {}
+    for n in range(rounds):
+        for suffix in ("pre", "post"):
+            # sebagian >200 baris agar heuristik autojunk difflib ikut diuji
+            size = rng.choice([rng.randint(0, 12), rng.randint(200, 300)])
+            lines = [rng.choice(pool) for _ in range(size)]
+            eol = rng.choice(["\n", "\r\n"])
+            text = "".join(ln + eol for ln in lines)
+            key = f"D{n}_{suffix}"
+            texts[key] = lines
+            fleet.add_text(key, text)
+
+    for n in range(rounds):
+        a_key, b_key = f"D{n}_pre", f"D{n}_post"
+        expected = "".join(difflib.unified_diff(
+            [ln + "\n" for ln in texts[a_key]],
+            [ln + "\n" for ln in texts[b_key]],
+            fromfile=a_key, tofile=b_key))
+        assert fleet.diff(a_key, b_key) == expected, f"diff beda: {a_key}"
+
+    for pattern in ("vlan 50", "line 1", "\r", "tidak-ada"):
+        expected = {}
+        for key, lines in texts.items():
+            hits = [ln for ln in lines if pattern in ln]
+            if hits:
+                expected[key] = hits
+        assert fleet.search(pattern) == expected, f"search beda: {pattern!r}"
+
+    print(f"[OK] Self-check lulus ({rounds} pasang konfigurasi).")
+
+# ============================================================
+#                          MAIN
+# ============================================================
+if __name__ == "__main__":
+    if sys.argv[1:] == ["--self-check"]:
+        self_check()
+        sys.exit(0)
+
+    pattern = sys.argv[1] if len(sys.argv) > 1 else None
+
+    fleet = FleetConfig()
+    if not fleet.load_dir():
+        print(f"[ERROR] Tidak ada file konfigurasi di folder '{BACKUP_DIR}'.")
+        sys.exit(1)
+
+    info = fleet.stats()
+    print(f"Dimuat {info['configs']} konfigurasi: "
+          f"{info['total_lines']} baris, {info['unique_lines']} baris unik.")
+
+    print("\n=== DIFF PRE vs POST ===")
+    for key in sorted(fleet.configs):
+        if not key.endswith("_pre"):
+            continue
+        name = key[:-len("_pre")]
+        post_key = f"{name}_post"
+        if post_key not in fleet.configs:
+            continue
+        print(f"\n--- {name} ---")
+        diff_text = fleet.diff(key, post_key)
+        print(diff_text if diff_text else "  Tidak ada perubahan.")
+
+    if pattern:
+        print(f"\n=== PENCARIAN '{pattern}' ===")
+        found = fleet.search(pattern)
+        if not found:
+            print("  Tidak ditemukan.")
+        for key, hits in sorted(found.items()):
+            print(f"  {key}:")
+            for ln in hits:
+                print(f"    {ln}")